@@ -0,0 +1,12 @@
+# gunicorn.conf.py
+# Servidor de produção: `gunicorn app:app` (lê este arquivo automaticamente)
+
+import multiprocessing
+
+bind = "0.0.0.0:5000"
+
+# Um processo por núcleo, cada um com várias threads para atender requisições em paralelo
+worker_class = "gthread"
+workers = multiprocessing.cpu_count()
+threads = 16
+timeout = 60
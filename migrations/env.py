@@ -0,0 +1,46 @@
+# migrations/env.py
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+# Apenas a URL e os modelos: não importa 'app' (cliente Gemini, Redis, fila)
+from models import DATABASE_URI, db
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# Metadados dos modelos (Caso) usados pelo `alembic revision --autogenerate`
+target_metadata = db.metadata
+
+
+def run_migrations_offline():
+    """Gera o SQL das migrações sem conectar ao banco (`alembic upgrade head --sql`)."""
+    context.configure(
+        url=DATABASE_URI,
+        target_metadata=target_metadata,
+        literal_binds=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """Aplica as migrações conectando diretamente ao MySQL."""
+    engine = create_engine(DATABASE_URI, poolclass=pool.NullPool)
+
+    with engine.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,33 @@
+"""Esquema inicial: tabela 'caso' como criada pelo antigo db.create_all()
+
+Bancos já existentes (criados pelo db.create_all()) não devem rodar esta revisão:
+marque-os com `alembic stamp 0001` e depois rode `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'caso',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('area_problema', sa.String(length=100), nullable=False),
+        sa.Column('fatos_chave', sa.Text(), nullable=False),
+        sa.Column('urgencia', sa.String(length=20), nullable=False),
+        sa.Column('timestamp', sa.DateTime(), nullable=True),
+        sa.Column('status', sa.String(length=50), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_table('caso')
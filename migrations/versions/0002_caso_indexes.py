@@ -0,0 +1,27 @@
+"""Índices da fila do especialista em 'caso'
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_caso_timestamp', 'caso', ['timestamp'])
+    # Fila do especialista: WHERE status = ... ORDER BY timestamp
+    op.create_index('ix_caso_status_ts', 'caso', ['status', 'timestamp'])
+    # Fila do especialista por área: WHERE status = ... AND area_problema = ... ORDER BY timestamp
+    op.create_index('ix_caso_status_area_ts', 'caso', ['status', 'area_problema', 'timestamp'])
+
+
+def downgrade():
+    op.drop_index('ix_caso_status_area_ts', table_name='caso')
+    op.drop_index('ix_caso_status_ts', table_name='caso')
+    op.drop_index('ix_caso_timestamp', table_name='caso')
@@ -0,0 +1,38 @@
+"""Converte caso.timestamp das linhas antigas para UTC
+
+Até aqui o timestamp era gravado com NOW(), no fuso do servidor MySQL; o app agora
+grava UTC. Esta revisão desloca as linhas existentes pela diferença atual entre o
+fuso da sessão e UTC (zero se o servidor já roda em UTC), para que o ORDER BY timestamp
+da fila do especialista não intercale linhas antigas e novas.
+
+Rode antes de subir a versão do app que grava UTC (etapa `alembic upgrade head` do deploy).
+Limitação: usa o deslocamento vigente no momento da migração; linhas gravadas sob outro
+deslocamento de horário de verão ficam com até 1h de diferença.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "UPDATE caso "
+        "SET timestamp = timestamp - INTERVAL TIMESTAMPDIFF(SECOND, UTC_TIMESTAMP(), NOW()) SECOND "
+        "WHERE timestamp IS NOT NULL"
+    )
+
+
+def downgrade():
+    op.execute(
+        "UPDATE caso "
+        "SET timestamp = timestamp + INTERVAL TIMESTAMPDIFF(SECOND, UTC_TIMESTAMP(), NOW()) SECOND "
+        "WHERE timestamp IS NOT NULL"
+    )
@@ -1,13 +1,36 @@
 # tasks.py
 
-def process_new_case_job(case_data):
+import logging
+
+logger = logging.getLogger("triage")
+
+
+def triage_and_persist(user_message):
     """
-    Função REAL que o Worker da fila irá executar (fora do __main__).
+    Job executado pelo Worker da fila 'cases': chama a LLM e persiste o caso no MySQL.
+    Retorna os dados da triagem como dict (resultado do job lido pela rota /jobs/<id>),
+    ou None se a LLM falhar de forma definitiva.
+
+    Só levanta exceção nas falhas que valem nova tentativa pelo Retry do RQ:
+    cota do Gemini esgotada (GeminiRateLimited), erro transitório do Gemini
+    (429/5xx, timeout, rede) e erro ao gravar no MySQL.
     """
-    print("--- INICIANDO PROCESSAMENTO DO CASO PELO WORKER ---")
-    print(f"Área Classificada: {case_data.get('area_problema')}")
-    print(f"Resumo do Caso: {case_data.get('fatos_chave')}")
-    # A lógica REAL de inserção no DB e envio de notificação entra aqui.
-    print("--- CASO PROCESSADO E ENVIADO PARA ATENDIMENTO ---")
+    # Importação tardia: 'app' importa este módulo para enfileirar o job
+    from app import app, call_llm_api, persist_case_to_sql
+
+    logger.info("--- INICIANDO TRIAGEM PELO WORKER ---")
+    triage = call_llm_api(user_message)
+
+    if triage is None:
+        # Erro definitivo (4xx não retentável, resposta fora do schema): não reenfileira
+        logger.error("❌ Triagem abandonada: falha definitiva da LLM.")
+        return None
+
+    with app.app_context():
+        caso_id = persist_case_to_sql(triage)
+        if caso_id is None:
+            raise RuntimeError("Falha ao registrar e direcionar o caso no banco de dados.")
+
+    logger.info("--- TRIAGEM CONCLUÍDA E CASO REGISTRADO ---")
+    return dict(triage.model_dump(), caso_id=caso_id)
 
-# (Não precisa de mais nada neste arquivo)
\ No newline at end of file
@@ -0,0 +1,17 @@
+# worker.py
+# Worker da fila 'cases', com o agendador do RQ: `python worker.py`
+# (equivale a `rq worker cases --with-scheduler -w rq.worker.SimpleWorker`)
+
+from rq.worker import SimpleWorker
+
+# Importa o app antes de iniciar o worker: o cliente Gemini, o pool do MySQL
+# e o pool do Redis são criados uma única vez e reutilizados por todos os jobs
+from app import q, redis_conn, use_direct_logging
+
+if __name__ == '__main__':
+    use_direct_logging()
+
+    # SimpleWorker executa os jobs no próprio processo, sem um fork por job
+    # (no fork, cada job recriaria os clientes e pools do zero)
+    # with_scheduler: recoloca na fila os jobs agendados pelo Retry (intervalos de TRIAGE_RETRY)
+    SimpleWorker([q], connection=redis_conn).work(with_scheduler=True)